@@ -0,0 +1,74 @@
+# cython: language_level=3
+"""Cython twin of the connected-components DFS used by map_processing.py.
+
+Compiled on import through pyximport; map_processing falls back to its
+pure-Python labeler if the build fails.
+"""
+import numpy as np
+
+cimport cython
+from libc.stdlib cimport malloc, free
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def dfs_label(unsigned char[:, ::1] blocked):
+    """Label 4-connected free cells of a uint8 blocked grid.
+
+    Returns (comp_id, num_components) where comp_id is an int32 array holding
+    -1 for blocked cells and 0..num_components-1 otherwise.
+    """
+    cdef int height = blocked.shape[0]
+    cdef int width = blocked.shape[1]
+    comp_id_arr = np.full((height, width), -1, dtype=np.int32)
+    cdef int[:, ::1] comp_id = comp_id_arr
+    cdef int *stack_x = <int *>malloc(height * width * sizeof(int))
+    cdef int *stack_y = <int *>malloc(height * width * sizeof(int))
+    if stack_x == NULL or stack_y == NULL:
+        free(stack_x)
+        free(stack_y)
+        raise MemoryError()
+
+    cdef int num_components = 0
+    cdef int x, y, cx, cy, cid
+    cdef int sp
+    try:
+        for y in range(height):
+            for x in range(width):
+                if blocked[y, x] != 0 or comp_id[y, x] != -1:
+                    continue
+                cid = num_components
+                num_components += 1
+                comp_id[y, x] = cid
+                stack_x[0] = x
+                stack_y[0] = y
+                sp = 1
+                while sp > 0:
+                    sp -= 1
+                    cx = stack_x[sp]
+                    cy = stack_y[sp]
+                    # Cells are marked on push, so the stack never exceeds H*W
+                    if cx + 1 < width and blocked[cy, cx + 1] == 0 and comp_id[cy, cx + 1] == -1:
+                        comp_id[cy, cx + 1] = cid
+                        stack_x[sp] = cx + 1
+                        stack_y[sp] = cy
+                        sp += 1
+                    if cx > 0 and blocked[cy, cx - 1] == 0 and comp_id[cy, cx - 1] == -1:
+                        comp_id[cy, cx - 1] = cid
+                        stack_x[sp] = cx - 1
+                        stack_y[sp] = cy
+                        sp += 1
+                    if cy + 1 < height and blocked[cy + 1, cx] == 0 and comp_id[cy + 1, cx] == -1:
+                        comp_id[cy + 1, cx] = cid
+                        stack_x[sp] = cx
+                        stack_y[sp] = cy + 1
+                        sp += 1
+                    if cy > 0 and blocked[cy - 1, cx] == 0 and comp_id[cy - 1, cx] == -1:
+                        comp_id[cy - 1, cx] = cid
+                        stack_x[sp] = cx
+                        stack_y[sp] = cy - 1
+                        sp += 1
+    finally:
+        free(stack_x)
+        free(stack_y)
+    return comp_id_arr, num_components
@@ -1,93 +1,386 @@
+import mmap
 import os
-import random
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+try:
+    from scipy.ndimage import label
+except ImportError:  # fall back to the union-find labeler below
+    label = None
+
+njit = None
+if label is None:
+    # Numba is only a fallback for SciPy; importing it costs a few hundred ms
+    try:
+        from numba import njit
+    except ImportError:  # fall back to the union-find labeler below
+        njit = None
+
+ccomp = None
+if label is None and njit is None:
+    # Neither SciPy nor Numba: try building the Cython labeler (ccomp.pyx) on import
+    try:
+        import pyximport
+        pyximport.install(setup_args={"include_dirs": np.get_include()}, language_level=3)
+        import ccomp
+    except Exception:  # no Cython or the build failed; use the union-find labeler
+        ccomp = None
+
+FREE_CELLS = b".G"
+BLOCKED_CELLS = b"@OTSW"
+
+# Byte translation table for process_map_to_binary: free -> '0', newline kept, everything else -> '1'
+BINARY_TABLE = bytearray(b"1" * 256)
+for c in FREE_CELLS:
+    BINARY_TABLE[c] = ord("0")
+BINARY_TABLE[ord("\n")] = ord("\n")
+BINARY_TABLE = bytes(BINARY_TABLE)
+
+FOUR_CONNECTED = np.array([[0, 1, 0],
+                           [1, 1, 1],
+                           [0, 1, 0]])
+
+def read_header(mm, num_lines):
+    """Return the first `num_lines` lines of a mapped file and the offset just past them."""
+    lines = []
+    offset = 0
+    for _ in range(num_lines):
+        line_end = mm.find(b"\n", offset)
+        if line_end == -1:
+            raise ValueError("Map file error: truncated header")
+        lines.append(mm[offset:line_end].strip())
+        offset = line_end + 1
+    return lines, offset
+
+def read_char_grid(mm, offset, width, height):
+    """Return a (height, width) uint8 view of the cell characters in `mm` from `offset` on.
+
+    Rows are `width` cells followed by a single newline, so the grid is a
+    strided view of the mapping with the newline column sliced off; no
+    per-row strings or copies are made.
+    """
+    stride = width + 1
+    count = min(height * stride, len(mm) - offset)
+    data = np.frombuffer(mm, dtype=np.uint8, count=count, offset=offset)
+    if data.size == height * stride - 1:
+        # Last row has no trailing newline; pad it (this one copies)
+        data = np.append(data, np.uint8(ord("\n")))
+    if data.size == height * stride:
+        rows = data.reshape(height, stride)
+        # Exactly one newline per row, and it sits in the last column
+        newlines = rows == ord("\n")
+        if newlines[:, width].all() and np.count_nonzero(newlines) == height:
+            return rows[:, :width]
+    raise ValueError(describe_grid_error(mm, offset, width, height))
+
+def describe_grid_error(mm, offset, width, height):
+    """Explain why the body at `offset` doesn't hold `height` rows of `width` cells."""
+    data = np.frombuffer(mm, dtype=np.uint8, offset=offset)
+    newlines = np.flatnonzero(data == ord("\n"))
+    row_starts = np.concatenate(([0], newlines + 1))[:height]
+    row_ends = np.append(newlines, data.size)[:height]
+    if len(row_starts) != height:
+        return f"Map file error: found {len(row_starts)} rows, expected height {height}"
+    lengths = row_ends - row_starts
+    bad = np.flatnonzero(lengths != width)
+    if bad.size:
+        return f"Map file error: row length {lengths[bad[0]]} does not equal width {width}"
+    return f"Map file error: rows are not {width} cells followed by a single newline"
 
 def process_map_to_binary(input_map, outfile):
-    free = [".", "G"]
-    blocked = ["@", "O", "T", "S", "W"]
-    with open(input_map, 'r') as infile, open(outfile, 'w') as out:
-        type = infile.readline().strip()
-        height_line = infile.readline().strip()
-        width_line = infile.readline().strip()
-        blank_line = infile.readline().strip()
-
-        height = int(height_line.split()[1])
-        width = int(width_line.split()[1])
+    with open(input_map, 'rb') as infile, open(outfile, 'wb') as out:
+        # The mapping is released once the arrays viewing it are garbage collected
+        mm = mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_READ)
+        # Header is always: type, "height N", "width M", "map"
+        header, body_start = read_header(mm, 4)
+        if not (header[1].startswith(b"height ") and header[2].startswith(b"width ")):
+            raise ValueError("Map file error: expected 'height N' and 'width M' header lines")
+        height = int(header[1][7:])
+        width = int(header[2][6:])
+        cells = read_char_grid(mm, body_start, width, height)
+
+        # Extra trailing column holds the newline so the whole body is one buffer
+        char_grid = np.full((height, width + 1), ord('\n'), dtype=np.uint8)
+        char_grid[:, :width] = cells
+        body = char_grid.tobytes()
+        invalid = body.translate(None, FREE_CELLS + BLOCKED_CELLS + b"\n")
+        if invalid:
+            raise ValueError(f"Map file error: unexpected cell character {invalid[:1].decode('ascii', 'replace')!r}")
         # Binary maps in this project use "width height" on the first line
-        out.write(f"{width} {height}\n")
-
-        grid = []
-        for _ in range(height):
-            row_data = infile.readline().strip()
-            if len(row_data) != width:
-                raise ValueError(f"Map file error: row length {len(row_data)} does not equal width {width}")
-            
-            row = []
-            for c in row_data:
-                if c in free:
-                    row.append(0)
-                else:
-                    row.append(1)
-            grid.append(row)
-            out.write("".join(str(x) for x in row) + "\n")
+        out.write(f"{width} {height}\n".encode('ascii') + body.translate(BINARY_TABLE))
 
-def compute_components(grid, width, height):
-    """Label connected components of free cells; returns list of lists of (x,y)."""
-    comps = []
-    comp_id = [[-1 for _ in range(width)] for _ in range(height)]
-    dirs = [(1,0),(-1,0),(0,1),(0,-1)]
-    for y in range(height):
-        for x in range(width):
-            if grid[y][x] != 0 or comp_id[y][x] != -1:
-                continue
-            cid = len(comps)
-            stack = [(x, y)]
-            cells = []
-            while stack:
-                cx, cy = stack.pop()
-                if comp_id[cy][cx] != -1:
+def adjacent_free_pairs(free):
+    """Find horizontally and vertically adjacent free cells using packed row bitsets.
+
+    Each row is packed into uint64 words (one bit per cell), so a neighbor test
+    is a shift and an AND over 64 cells. Returns flat indices idx such that
+    idx/idx+1 (right_edges) or idx/idx+width (down_edges) are both free.
+    """
+    height, width = free.shape
+    words = -(-width // 64)
+    padded = np.zeros((height, words * 64), dtype=bool)
+    padded[:, :width] = free
+    rows = np.packbits(padded, axis=1, bitorder='little').view('<u8')
+
+    # Bit x of `shifted` is bit x+1 of the row, carrying across word boundaries
+    shifted = rows >> np.uint64(1)
+    shifted[:, :-1] |= rows[:, 1:] << np.uint64(63)
+    right = rows & shifted
+    down = rows[:-1] & rows[1:]
+
+    def set_bits(edges):
+        bits = np.unpackbits(edges.view(np.uint8), axis=1, bitorder='little')
+        ys, xs = np.nonzero(bits)
+        return ys * width + xs
+
+    return set_bits(right), set_bits(down)
+
+def label_union_find(free):
+    """Label 4-connected components of a boolean free mask with union-find.
+
+    Mirrors scipy.ndimage.label: returns (labels, num_labels) where blocked
+    cells are 0 and components are numbered 1..num_labels.
+    """
+    height, width = free.shape
+    # Dense int32/int8 buffers instead of per-cell boxed Python ints
+    parent = array('i', range(width * height))
+    rank = array('b', bytes(width * height))
+
+    def find(i):
+        root = i
+        while parent[root] != root:
+            root = parent[root]
+        while parent[i] != root:
+            parent[i], i = root, parent[i]
+        return root
+
+    def union(a, b):
+        ra, rb = find(a), find(b)
+        if ra == rb:
+            return
+        if rank[ra] < rank[rb]:
+            ra, rb = rb, ra
+        parent[rb] = ra
+        if rank[ra] == rank[rb]:
+            rank[ra] += 1
+
+    # Join every pair of adjacent free cells, found 64 cells at a time on the bitsets
+    right_edges, down_edges = adjacent_free_pairs(free)
+    for idx in right_edges.tolist():
+        union(idx, idx + 1)
+    for idx in down_edges.tolist():
+        union(idx, idx + width)
+
+    # Flatten every chain to its root with vectorized pointer jumping
+    roots = np.frombuffer(parent, dtype=np.int32)
+    while True:
+        jumped = roots[roots]
+        if np.array_equal(jumped, roots):
+            break
+        roots = jumped
+
+    labels = np.zeros(width * height, dtype=np.int32)
+    free_idx = np.flatnonzero(free)
+    if free_idx.size == 0:
+        return labels.reshape(height, width), 0
+    unique_roots, inverse = np.unique(roots[free_idx], return_inverse=True)
+    labels[free_idx] = inverse + 1
+    return labels.reshape(height, width), len(unique_roots)
+
+if njit is not None:
+    @njit(cache=True)
+    def dfs_label_kernel(blocked):
+        """Native DFS over a uint8 blocked grid; returns (comp_id, num_components).
+
+        comp_id holds -1 for blocked cells and 0..num_components-1 otherwise.
+        """
+        height, width = blocked.shape
+        comp_id = np.full((height, width), -1, np.int32)
+        stack_x = np.empty(height * width, np.int32)
+        stack_y = np.empty(height * width, np.int32)
+        num_components = 0
+        for y in range(height):
+            for x in range(width):
+                if blocked[y, x] != 0 or comp_id[y, x] != -1:
                     continue
-                comp_id[cy][cx] = cid
-                cells.append((cx, cy))
-                for dx, dy in dirs:
-                    nx, ny = cx + dx, cy + dy
-                    if 0 <= nx < width and 0 <= ny < height and grid[ny][nx] == 0 and comp_id[ny][nx] == -1:
-                        stack.append((nx, ny))
-            comps.append(cells)
-    return comps
-
-def pick_random_start_goal(map_file, num_agents, outfile):
-    with open(map_file, 'r') as mapf, open(outfile, 'w') as out:
-        out.write(f"{num_agents}\n")
-        width_str, height_str = mapf.readline().strip().split()
+                cid = num_components
+                num_components += 1
+                comp_id[y, x] = cid
+                stack_x[0] = x
+                stack_y[0] = y
+                sp = 1
+                while sp > 0:
+                    sp -= 1
+                    cx = stack_x[sp]
+                    cy = stack_y[sp]
+                    if cx + 1 < width and blocked[cy, cx + 1] == 0 and comp_id[cy, cx + 1] == -1:
+                        comp_id[cy, cx + 1] = cid
+                        stack_x[sp] = cx + 1
+                        stack_y[sp] = cy
+                        sp += 1
+                    if cx > 0 and blocked[cy, cx - 1] == 0 and comp_id[cy, cx - 1] == -1:
+                        comp_id[cy, cx - 1] = cid
+                        stack_x[sp] = cx - 1
+                        stack_y[sp] = cy
+                        sp += 1
+                    if cy + 1 < height and blocked[cy + 1, cx] == 0 and comp_id[cy + 1, cx] == -1:
+                        comp_id[cy + 1, cx] = cid
+                        stack_x[sp] = cx
+                        stack_y[sp] = cy + 1
+                        sp += 1
+                    if cy > 0 and blocked[cy - 1, cx] == 0 and comp_id[cy - 1, cx] == -1:
+                        comp_id[cy - 1, cx] = cid
+                        stack_x[sp] = cx
+                        stack_y[sp] = cy - 1
+                        sp += 1
+        return comp_id, num_components
+
+def label_numba(free):
+    """Label 4-connected components with the JIT-compiled DFS kernel.
+
+    Returns (labels, num_labels) in the same convention as scipy.ndimage.label.
+    """
+    blocked = np.ascontiguousarray(~free, dtype=np.uint8)
+    comp_id, num_labels = dfs_label_kernel(blocked)
+    return comp_id + 1, num_labels
+
+def label_cython(free):
+    """Label 4-connected components with the compiled ccomp.dfs_label kernel.
+
+    Returns (labels, num_labels) in the same convention as scipy.ndimage.label.
+    """
+    blocked = np.ascontiguousarray(~free, dtype=np.uint8)
+    comp_id, num_labels = ccomp.dfs_label(blocked)
+    return comp_id + 1, num_labels
+
+def compute_components(grid, width, height):
+    """Label 4-connected components of free cells in a blocked mask.
+
+    Returns a list of (N, 2) int32 arrays of (x, y) coordinates, one per component.
+    """
+    free = ~np.asarray(grid, dtype=bool).reshape(height, width)
+    if label is not None:
+        labels, num_labels = label(free, structure=FOUR_CONNECTED)
+    elif njit is not None:
+        labels, num_labels = label_numba(free)
+    elif ccomp is not None:
+        labels, num_labels = label_cython(free)
+    else:
+        labels, num_labels = label_union_find(free)
+
+    return group_components(labels, num_labels)
+
+def group_components(labels, num_labels):
+    """Split a (height, width) label array into per-label (N, 2) int32 arrays of (x, y).
+
+    One stable argsort over the labelled cells replaces per-cell appends; the
+    split points for labels 1..num_labels come from searchsorted.
+    """
+    width = labels.shape[1]
+    flat = labels.ravel()
+    cell_idx = np.flatnonzero(flat > 0)
+    cell_labels = flat[cell_idx]
+    order = np.argsort(cell_labels, kind='stable')
+    cell_idx = cell_idx[order]
+    # One int32 (x, y) buffer for every free cell; components are slices of it
+    coords = np.empty((cell_idx.size, 2), dtype=np.int32)
+    np.remainder(cell_idx, width, out=coords[:, 0], casting='unsafe')
+    np.floor_divide(cell_idx, width, out=coords[:, 1], casting='unsafe')
+    bounds = np.searchsorted(cell_labels[order], np.arange(1, num_labels + 2))
+    return [coords[bounds[i]:bounds[i + 1]] for i in range(num_labels)]
+
+def load_map(map_file):
+    """Parse a binary map and label its free regions.
+
+    Returns (width, height, components) where components holds only regions
+    with at least 2 cells (anything smaller can't host a start/goal pair).
+    """
+    with open(map_file, 'rb') as mapf:
+        mm = mmap.mmap(mapf.fileno(), 0, access=mmap.ACCESS_READ)
+        header, body_start = read_header(mm, 1)
+        width_str, height_str = header[0].split()
         width = int(width_str)
         height = int(height_str)
-        print(f"Processing map {map_file} of size {width}x{height} for {num_agents} agents.")
-        grid = []
-        for _ in range(height):
-            row = mapf.readline().strip()
-            if len(row) != width:
-                raise ValueError(f"Map row length {len(row)} != width {width}")
-            grid.append([int(c) for c in row])
-
-        # Precompute connected components of free cells to ensure reachability
-        components = compute_components(grid, width, height)
-        # Remove any components with fewer than 2 cells (can't host a start/goal pair)
-        components = [c for c in components if len(c) >= 2]
-        if not components:
-            raise ValueError("No connected free regions with at least 2 cells.")
-
-        for agent in range(num_agents):
-            # Pick a component that still has at least 2 free cells
-            components = [c for c in components if len(c) >= 2]
-            if not components:
+        print(f"Processing map {map_file} of size {width}x{height}.")
+        # Boolean blocked mask: True where the cell is an obstacle ('1')
+        grid = read_char_grid(mm, body_start, width, height) == ord('1')
+
+    # Precompute connected components of free cells to ensure reachability
+    components = compute_components(grid, width, height)
+    components = [c for c in components if len(c) >= 2]
+    if not components:
+        raise ValueError("No connected free regions with at least 2 cells.")
+    return width, height, components
+
+def sample_scenario(components, num_agents, outfile, rng=None):
+    """Write `num_agents` random start/goal pairs drawn from `components`.
+
+    Components are chosen in proportion to their size, among those that still
+    have at least 2 unused cells. Picked cells are swapped
+    to the end of their component array and the unused prefix shrinks, so the
+    arrays are permuted in place but keep the same cells and can be reused for
+    several scenarios. Pass a seeded np.random.Generator for reproducibility.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    sizes = np.array([len(c) for c in components])
+    remaining = sizes.tolist()
+    # Components that still have at least 2 free cells, with each one's slot in
+    # `live` so exhausted components can be dropped by swap-and-pop in O(1)
+    live = list(range(len(components)))
+    live_pos = list(range(len(components)))
+
+    def retire(comp_idx):
+        pos = live_pos[comp_idx]
+        last = live.pop()
+        if last != comp_idx:
+            live[pos] = last
+            live_pos[last] = pos
+        live_pos[comp_idx] = -1
+
+    # Draw every component pick and cell position in one batch; a pick only
+    # needs redrawing when it lands on an exhausted component
+    comp_picks = rng.choice(len(components), size=num_agents, p=sizes / sizes.sum()).tolist()
+    draws = rng.random((num_agents, 2)).tolist()
+
+    lines = [f"{num_agents}\n"]
+    for comp_idx, draw in zip(comp_picks, draws):
+        if live_pos[comp_idx] == -1:
+            if not live:
                 raise ValueError("Not enough connected free cells to assign start and goal positions for all agents.")
-            comp = random.choice(components)
-            start_idx = random.randrange(len(comp))
-            start = comp.pop(start_idx)
-            goal_idx = random.randrange(len(comp))
-            goal = comp.pop(goal_idx)
-            out.write(f"{start[0]} {start[1]} {goal[0]} {goal[1]}\n")
-            
+            # Redraw among the live components, still weighted by size
+            live_sizes = sizes[live]
+            comp_idx = live[rng.choice(len(live), p=live_sizes / live_sizes.sum())]
+        comp = components[comp_idx]
+        picked = []
+        for u in draw:
+            # Swap a uniformly chosen unused cell to the end of the unused prefix
+            n = remaining[comp_idx]
+            i = min(int(u * n), n - 1)
+            comp[[i, n - 1]] = comp[[n - 1, i]]
+            remaining[comp_idx] = n - 1
+            picked.append(comp[n - 1].tolist())
+        if remaining[comp_idx] < 2:
+            retire(comp_idx)
+        (sx, sy), (gx, gy) = picked
+        lines.append(f"{sx} {sy} {gx} {gy}\n")
+    with open(outfile, 'wb') as out:
+        out.write("".join(lines).encode('ascii'))
+
+def pick_random_start_goal(map_file, num_agents, outfile, seed=None):
+    width, height, components = load_map(map_file)
+    sample_scenario(components, num_agents, outfile, np.random.default_rng(seed))
+
+def scenario_job(task):
+    """Parse one map, then write a scenario for each (num_agents, out_path) pair."""
+    map_path, scenarios, seed = task
+    rng = np.random.default_rng(seed)
+    width, height, components = load_map(map_path)
+    for num_agents, out_path in scenarios:
+        sample_scenario(components, num_agents, out_path, rng)
+
 if __name__ == "__main__":
     # benchmark_dir = r"MAPF_benchmark_maps"
     # for file in os.listdir(benchmark_dir):
@@ -95,12 +388,21 @@ if __name__ == "__main__":
     #         inpath = os.path.join(benchmark_dir, file)
     #         outpath = os.path.join(r"Processed_MAPF_maps", file[:-4] + "_binary.map")
     #         process_map_to_binary(inpath, outpath)
-    
+
     processed_dir = r"Processed_MAPF_maps"
     out_dir = r"Random_agent_scenarios"
+    tasks = []
     for file in os.listdir(processed_dir):
         if file.endswith("_binary.map"):
             map_path = os.path.join(processed_dir, file)
+            scenarios = []
             for num_agents in [10, 20, 30]:
                 out_path = os.path.join(out_dir, str(num_agents) + "_" + file[:-11] + "_scenario.txt")
-                pick_random_start_goal(map_path, num_agents, out_path)
+                scenarios.append((num_agents, out_path))
+            tasks.append((map_path, scenarios))
+
+    # Maps are independent; give each one its own child seed so workers never share a stream
+    seeds = np.random.SeedSequence().spawn(len(tasks))
+    tasks = [(map_path, scenarios, seed) for (map_path, scenarios), seed in zip(tasks, seeds)]
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+        list(ex.map(scenario_job, tasks))
@@ -9,15 +9,75 @@ Author: Generated for ParallelCBS project
 """
 
 import pandas as pd
+import matplotlib
+# Batch pipeline: render off-screen with Agg and thin out near-collinear path vertices
+matplotlib.use('Agg')
+matplotlib.rcParams['path.simplify'] = True
+matplotlib.rcParams['path.simplify_threshold'] = 1.0
+matplotlib.rcParams['agg.path.chunksize'] = 10000
+# Pooled figures stay open for reuse (see get_fig)
+matplotlib.rcParams['figure.max_open_warning'] = 0
 import matplotlib.pyplot as plt
+plt.ioff()
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_hex
+from matplotlib.lines import Line2D
 import numpy as np
 import os
+import functools
+import hashlib
+import inspect
+import json
+import pickle
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Configuration
 NUM_PROCESSORS = 16
 RESULTS_DIR = Path("final_results")
 OUTPUT_DIR = Path("plots")
+CACHE_DIR = Path(".cache")
+# Records which inputs and code produced each plot, so unchanged plots can be skipped
+MANIFEST_FILE = OUTPUT_DIR / ".manifest.json"
+# Data artists with more points than this are rasterized in PDF output
+RASTERIZE_THRESHOLD = 500
+
+RESULT_FILES = [
+    RESULTS_DIR / "results_serial_nano.csv",
+    RESULTS_DIR / "results_central_nano.csv",
+    RESULTS_DIR / "results_decentral_nano.csv",
+]
+
+# Only the columns the pipeline uses, parsed straight into compact dtypes
+# (nullable ints so the empty separator rows still parse; nodes_expanded is
+# written as long long by the C drivers, so it stays 64-bit)
+RESULT_DTYPES = {
+    'map': 'category',
+    'agents': 'Int32',
+    'status': 'category',
+    'nodes_expanded': 'Int64',
+    'runtime_sec': 'float32',
+    'comm_time_sec': 'float32',
+    'compute_time_sec': 'float32',
+}
+
+# The pyarrow CSV reader/writer is multithreaded; fall back to pandas' C parser without it
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    CSV_ENGINE = "pyarrow"
+except ImportError:
+    CSV_ENGINE = "c"
+
+# datashader renders very large scatters as one image; optional, matplotlib is the fallback
+try:
+    import datashader as ds
+    import datashader.transfer_functions as tf
+except ImportError:
+    ds = None
+# Above this many points, backend='auto' switches the speedup scatter to datashader
+DATASHADER_THRESHOLD = 2000
 
 # Color scheme for consistency
 COLORS = {
@@ -25,23 +85,152 @@ COLORS = {
     'centralized': '#A23B72',  # Magenta
     'decentralized': '#F18F01' # Orange
 }
+VERSIONS = ['serial', 'centralized', 'decentralized']
+
+# One reusable figure per figsize, per process
+_FIG_POOL = {}
+
+def input_hash(paths=RESULT_FILES):
+    """Hash the contents of the input files; identical inputs give identical keys."""
+    h = hashlib.blake2b(digest_size=16)
+    for path in paths:
+        h.update(str(path).encode())
+        h.update(Path(path).read_bytes())
+    return h.hexdigest()
+
+@functools.lru_cache(maxsize=None)
+def source_hash():
+    """Hash this module's source, so editing any parsing or aggregation code changes the key."""
+    return hashlib.blake2b(Path(__file__).read_bytes(), digest_size=16).hexdigest()
+
+def data_hash(*objs):
+    """Hash the contents of DataFrames/Series (values, index, columns, dtypes) and other picklable args."""
+    h = hashlib.blake2b(digest_size=16)
+    for obj in objs:
+        if isinstance(obj, (pd.DataFrame, pd.Series)):
+            h.update(pd.util.hash_pandas_object(obj, index=True).to_numpy().tobytes())
+            if isinstance(obj, pd.DataFrame):
+                h.update(repr(list(obj.columns)).encode())
+                h.update(repr(list(obj.dtypes)).encode())
+            else:
+                h.update(repr((obj.name, obj.dtype)).encode())
+        else:
+            h.update(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+    return h.hexdigest()
+
+def replace_atomically(path, write):
+    """Call write(tmp_path) on a temp file next to `path`, then move it over `path`.
+
+    os.replace is atomic, so readers see either the old file or the complete
+    new one, never a partial write from an interrupted run.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+def cached_on_inputs(func):
+    """Memoize func's result in CACHE_DIR, keyed by the input CSVs and this module's source.
+
+    Editing the result files or any code in this file (func itself, the CSV
+    helpers it calls, RESULT_DTYPES, ...) produces a new key, so stale results
+    are never reused.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        h = hashlib.blake2b(digest_size=16)
+        h.update(input_hash().encode())
+        h.update(source_hash().encode())
+        cache_file = CACHE_DIR / f"{func.__name__}_{h.hexdigest()}.pkl"
+        if cache_file.exists():
+            try:
+                with open(cache_file, 'rb') as f:
+                    return pickle.load(f)
+            except Exception:
+                # Truncated entry, or one pickled by an incompatible pandas; rebuild it
+                cache_file.unlink(missing_ok=True)
+        result = func(*args, **kwargs)
+        CACHE_DIR.mkdir(exist_ok=True)
+        
+        def dump(tmp_path):
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        replace_atomically(cache_file, dump)
+        # Entries under older keys can never be hit again
+        for old in CACHE_DIR.glob(f"{func.__name__}_*.pkl"):
+            if old != cache_file:
+                old.unlink(missing_ok=True)
+        return result
+    return wrapper
+
+def cached_parquet(func):
+    """Memoize a no-argument func's DataFrame result as parquet in CACHE_DIR.
 
+    func must derive everything from RESULT_FILES, so like cached_on_inputs the
+    key is just the input CSVs and this module's source. Without pyarrow the
+    result is simply recomputed on every run.
+    """
+    @functools.wraps(func)
+    def wrapper():
+        if CSV_ENGINE != "pyarrow":
+            return func()
+        h = hashlib.blake2b(digest_size=16)
+        h.update(input_hash().encode())
+        h.update(source_hash().encode())
+        cache_file = CACHE_DIR / f"{func.__name__}_{h.hexdigest()}.parquet"
+        if cache_file.exists():
+            try:
+                return pd.read_parquet(cache_file)
+            except Exception:
+                # Truncated or unreadable entry; rebuild it
+                cache_file.unlink(missing_ok=True)
+        result = func()
+        CACHE_DIR.mkdir(exist_ok=True)
+        replace_atomically(cache_file, result.to_parquet)
+        # Entries under older keys can never be hit again
+        for old in CACHE_DIR.glob(f"{func.__name__}_*.parquet"):
+            if old != cache_file:
+                old.unlink(missing_ok=True)
+        return result
+    return wrapper
+
+def read_results_csv(path):
+    """Read one results CSV with explicit dtypes, dropping empty rows."""
+    with open(path) as f:
+        header = f.readline().strip().split(',')
+    # Older CSVs lack the comm/compute columns, so only request what's there
+    usecols = [col for col in RESULT_DTYPES if col in header]
+    dtype = {col: RESULT_DTYPES[col] for col in usecols}
+    try:
+        df = pd.read_csv(path, engine=CSV_ENGINE, usecols=usecols, dtype=dtype)
+    except pd.errors.ParserError:
+        # pyarrow rejects ragged separator rows that the C parser pads with NaN
+        df = pd.read_csv(path, engine="c", usecols=usecols, dtype=dtype)
+    # Rows without a map or agent count can't be grouped; a missing
+    # nodes_expanded is kept as <NA>
+    df = df.dropna(subset=['map', 'agents'])
+    return df.astype({'agents': 'int32'})
+
+@cached_on_inputs
 def load_results():
     """Load all CSV result files."""
-    serial = pd.read_csv(RESULTS_DIR / "results_serial_nano.csv")
-    central = pd.read_csv(RESULTS_DIR / "results_central_nano.csv")
-    decentral = pd.read_csv(RESULTS_DIR / "results_decentral_nano.csv")
-    
-    # Clean up any empty rows
-    serial = serial.dropna(subset=['map'])
-    central = central.dropna(subset=['map'])
-    decentral = decentral.dropna(subset=['map'])
+    serial = read_results_csv(RESULT_FILES[0])
+    central = read_results_csv(RESULT_FILES[1])
+    decentral = read_results_csv(RESULT_FILES[2])
     
     # Add version labels
     serial['version'] = 'serial'
     central['version'] = 'centralized'
     decentral['version'] = 'decentralized'
     
+    # Display name for plot labels, e.g. 'arena_binary.map' -> 'arena'
+    for df in (serial, central, decentral):
+        df['map_short'] = df['map'].str.removesuffix('_binary.map').astype('category')
+    
     # Add comm/compute columns for serial (all compute, no comm)
     if 'comm_time_sec' not in serial.columns:
         serial['comm_time_sec'] = 0.0
@@ -57,74 +246,140 @@ def load_results():
     
     return serial, central, decentral
 
+def get_fig(figsize, nrows=1, ncols=1):
+    """plt.subplots() replacement that reuses a cleared figure of the same size.
+
+    Reusing the figure keeps its canvas and text/font caches warm across plots.
+    """
+    fig = _FIG_POOL.get(figsize)
+    if fig is None or not plt.fignum_exists(fig.number):
+        fig = _FIG_POOL[figsize] = plt.figure(figsize=figsize)
+    else:
+        fig.clf()
+        plt.figure(fig.number)
+    return fig, fig.subplots(nrows, ncols)
+
+def save_fig(fig, stem):
+    """Lay out `fig` once and write OUTPUT_DIR/<stem>.png and .pdf; the figure stays pooled."""
+    fig.tight_layout()
+    fig.savefig(OUTPUT_DIR / f'{stem}.png', dpi=150, bbox_inches='tight')
+    fig.savefig(OUTPUT_DIR / f'{stem}.pdf', bbox_inches='tight')
+    print(f"✓ Saved {stem}.png/pdf")
+
+def plot_key(plot_func, args, plot_funcs):
+    """Key for one plot: the contents of its arguments plus every piece of code it can depend on.
+
+    The code part is this module's source with the other plot functions in
+    `plot_funcs` cut out. Editing a shared helper, constant or the data
+    preparation redraws every plot; editing one plot_* function redraws only
+    that plot.
+    """
+    shared_source = Path(__file__).read_text()
+    for other in plot_funcs:
+        if other is not plot_func:
+            shared_source = shared_source.replace(inspect.getsource(other), '')
+    h = hashlib.blake2b(digest_size=16)
+    h.update(plot_func.__name__.encode())
+    h.update(data_hash(*args).encode())
+    h.update(shared_source.encode())
+    return h.hexdigest()
+
+def read_manifest():
+    """Load the plot manifest; a missing or unreadable one is empty, so every plot redraws."""
+    try:
+        manifest = json.loads(MANIFEST_FILE.read_text())
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+def plot_up_to_date(manifest, plot_func, key, stem):
+    """True if the manifest key matches and both output files still exist."""
+    return (manifest.get(plot_func.__name__) == key
+            and all((OUTPUT_DIR / f'{stem}.{ext}').exists() for ext in ('png', 'pdf')))
+
+def run_plot(job):
+    """Worker entry point: call one plot function with its arguments."""
+    plot_func, args = job
+    plot_func(*args)
+
+def success_runs(serial, central, decentral):
+    """Successful runs of all three versions stacked into one frame."""
+    all_data = pd.concat([serial, central, decentral])
+    return all_data[all_data['status'] == 'success']
+
+def runtime_by_agents(all_success):
+    """Per-(version, agents) means over successful runs, shared by the bar plots and summary.
+
+    nodes_mean skips runs that expanded no nodes (trivial instances).
+    """
+    nodes = all_success['nodes_expanded'].astype('float64')
+    return (all_success.assign(nodes_nonzero=nodes.where(nodes > 0))
+            .groupby(['version', 'agents'], observed=True)
+            .agg(runtime_mean=('runtime_sec', 'mean'),
+                 nodes_mean=('nodes_nonzero', 'mean'),
+                 n=('runtime_sec', 'size')))
+
+@cached_parquet
+def agg_runtime_by_agents():
+    """runtime_by_agents over the successful runs in RESULT_FILES, cached across runs."""
+    return runtime_by_agents(success_runs(*load_results()))
+
 def create_merged_dataset(serial, central, decentral):
     """Merge datasets on map and agents for comparison."""
-    # Create keys for merging
-    serial_success = serial[serial['status'] == 'success'].copy()
-    central_success = central[central['status'] == 'success'].copy()
-    decentral_success = decentral[decentral['status'] == 'success'].copy()
-    
+    # Index each version by (map, agents), keeping only the columns compared downstream
+    MERGE_COLS = ['runtime_sec', 'nodes_expanded']
     # Filter out anomalously fast runs (likely cached/trivial solutions)
     # These show 0.000xxx seconds and distort speedup calculations
     MIN_RUNTIME = 0.01  # 10ms minimum for meaningful comparison
-    serial_success = serial_success[serial_success['runtime_sec'] >= MIN_RUNTIME]
-    central_success = central_success[central_success['runtime_sec'] >= MIN_RUNTIME]
-    decentral_success = decentral_success[decentral_success['runtime_sec'] >= MIN_RUNTIME]
-    
-    # Merge serial with centralized
-    merged_central = serial_success.merge(
-        central_success,
-        on=['map', 'agents'],
-        suffixes=('_serial', '_central')
-    )
-    
-    # Merge serial with decentralized
-    merged_decentral = serial_success.merge(
-        decentral_success,
-        on=['map', 'agents'],
-        suffixes=('_serial', '_decentral')
-    )
+    serial_success, central_success, decentral_success = [
+        df.loc[(df['status'] == 'success') & (df['runtime_sec'] >= MIN_RUNTIME), ['map', 'map_short', 'agents'] + MERGE_COLS]
+          .set_index(['map', 'map_short', 'agents'])
+        for df in (serial, central, decentral)
+    ]
+    
+    # Join serial with each parallel version on the shared index
+    merged_central = serial_success.join(
+        central_success, how='inner', lsuffix='_serial', rsuffix='_central'
+    ).reset_index()
+    merged_decentral = serial_success.join(
+        decentral_success, how='inner', lsuffix='_serial', rsuffix='_decentral'
+    ).reset_index()
     
     return merged_central, merged_decentral
 
 def calculate_speedup_efficiency(merged_central, merged_decentral):
     """Calculate speedup and efficiency metrics."""
-    # Centralized speedup and efficiency
-    merged_central['speedup'] = merged_central['runtime_sec_serial'] / merged_central['runtime_sec_central']
-    merged_central['efficiency'] = merged_central['speedup'] / NUM_PROCESSORS * 100
-    
-    # Decentralized speedup and efficiency
-    merged_decentral['speedup'] = merged_decentral['runtime_sec_serial'] / merged_decentral['runtime_sec_decentral']
-    merged_decentral['efficiency'] = merged_decentral['speedup'] / NUM_PROCESSORS * 100
+    for merged, suffix in [(merged_central, 'central'), (merged_decentral, 'decentral')]:
+        rt_serial = merged['runtime_sec_serial'].to_numpy(dtype=np.float32)
+        rt_parallel = merged[f'runtime_sec_{suffix}'].to_numpy(dtype=np.float32)
+        speedup = np.divide(rt_serial, rt_parallel)
+        merged['speedup'] = speedup
+        # Efficiency as a percentage of ideal linear speedup
+        merged['efficiency'] = speedup * np.float32(100.0 / NUM_PROCESSORS)
     
     return merged_central, merged_decentral
 
-def plot_runtime_comparison(serial, central, decentral):
+def plot_runtime_comparison(serial, central, decentral, all_success=None, agg=None):
     """Plot runtime comparison across all versions."""
-    fig, ax = plt.subplots(figsize=(14, 8))
+    fig, ax = get_fig((14, 8))
     
-    # Combine all data
-    all_data = pd.concat([serial, central, decentral])
-    all_data = all_data[all_data['status'] == 'success']
+    if agg is None:
+        if all_success is None:
+            all_success = success_runs(serial, central, decentral)
+        agg = runtime_by_agents(all_success)
     
-    # Group by map and agents
-    maps = all_data['map'].unique()
-    agents_list = sorted(all_data['agents'].unique())
+    # Missing (agents, version) pairs plot as 0
+    runtimes = (agg['runtime_mean'].unstack('version')
+                .reindex(columns=VERSIONS)
+                .fillna(0))
+    agents_list = runtimes.index.tolist()
     
     # Create grouped bar chart
     x = np.arange(len(agents_list))
     width = 0.25
     
-    for i, version in enumerate(['serial', 'centralized', 'decentralized']):
-        version_data = all_data[all_data['version'] == version]
-        runtimes = []
-        for agents in agents_list:
-            agent_data = version_data[version_data['agents'] == agents]
-            if len(agent_data) > 0:
-                runtimes.append(agent_data['runtime_sec'].mean())
-            else:
-                runtimes.append(0)
-        ax.bar(x + i * width, runtimes, width, label=version.capitalize(), 
+    for i, version in enumerate(VERSIONS):
+        ax.bar(x + i * width, runtimes[version].to_numpy(), width, label=version.capitalize(), 
                color=COLORS[version], alpha=0.8)
     
     ax.set_xlabel('Number of Agents', fontsize=12)
@@ -136,22 +391,65 @@ def plot_runtime_comparison(serial, central, decentral):
     ax.grid(True, alpha=0.3)
     ax.set_yscale('log')
     
-    plt.tight_layout()
-    plt.savefig(OUTPUT_DIR / 'runtime_comparison.png', dpi=150, bbox_inches='tight')
-    plt.savefig(OUTPUT_DIR / 'runtime_comparison.pdf', bbox_inches='tight')
-    plt.close()
-    print("✓ Saved runtime_comparison.png/pdf")
+    save_fig(fig, 'runtime_comparison')
+
+def scatter_speedup_by_map(ax, merged, backend='auto'):
+    """Scatter speedup vs agents on `ax`, one color per map.
+
+    backend is 'matplotlib', 'datashader', or 'auto' (datashader when it is
+    installed and there are more than DATASHADER_THRESHOLD points).
+    """
+    if backend not in ('auto', 'matplotlib', 'datashader'):
+        raise ValueError(f"Unknown scatter backend: {backend}")
+    if backend == 'datashader' and ds is None:
+        raise ImportError("datashader backend requested but datashader is not installed")
+    if backend == 'auto':
+        backend = 'datashader' if ds is not None and len(merged) > DATASHADER_THRESHOLD else 'matplotlib'
+    
+    maps = list(merged['map_short'].unique())
+    if backend == 'matplotlib' or not maps:
+        # Large sweeps rasterize the markers so the PDF doesn't carry one vector path per point
+        rasterize = len(merged) > RASTERIZE_THRESHOLD
+        for map_name in maps:
+            map_data = merged[merged['map_short'] == map_name]
+            ax.scatter(map_data['agents'], map_data['speedup'], 
+                       label=map_name, s=80, alpha=0.7,
+                       rasterized=rasterize)
+        return
+    
+    # Aggregate every point into one categorical image and draw it with a single imshow
+    points = pd.DataFrame({
+        'agents': merged['agents'].to_numpy(dtype=np.float64),
+        'speedup': merged['speedup'].to_numpy(dtype=np.float64),
+        'map': pd.Categorical(merged['map_short'].astype(str), categories=[str(m) for m in maps]),
+    })
+    x0, x1 = points['agents'].min(), points['agents'].max()
+    # Cover the ideal-speedup line too, so the axes don't rescale the image afterwards
+    y0, y1 = 0.0, max(points['speedup'].max(), NUM_PROCESSORS)
+    # Pad the ranges so points on the edges aren't clipped
+    x_pad = max((x1 - x0) * 0.05, 1.0)
+    y_pad = max(y1 * 0.05, 0.1)
+    x_range, y_range = (x0 - x_pad, x1 + x_pad), (y0, y1 + y_pad)
+    # Match the canvas to the axes' pixel size so points aren't stretched by imshow
+    bbox = ax.get_window_extent()
+    canvas = ds.Canvas(plot_width=int(bbox.width), plot_height=int(bbox.height),
+                       x_range=x_range, y_range=y_range)
+    agg = canvas.points(points, 'agents', 'speedup', ds.count_cat('map'))
+    cycle = plt.rcParams['axes.prop_cycle'].by_key()['color']
+    # datashader wants hex strings; the cycle may hold RGB tuples in [0, 1]
+    color_key = {str(m): to_hex(cycle[i % len(cycle)]) for i, m in enumerate(maps)}
+    img = tf.spread(tf.shade(agg, color_key=color_key, min_alpha=180), px=3)
+    ax.imshow(img.to_pil(), extent=[*x_range, *y_range], origin='upper', aspect='auto')
+    for map_name in maps:
+        ax.scatter([], [], color=color_key[str(map_name)], s=80, alpha=0.7, label=map_name)
 
-def plot_speedup_analysis(merged_central, merged_decentral):
+def plot_speedup_analysis(merged_central, merged_decentral, backend='auto'):
     """Plot speedup analysis for parallel versions."""
-    fig, axes = plt.subplots(1, 2, figsize=(14, 6))
+    fig, axes = get_fig((14, 6), 1, 2)
     
     # Centralized speedup
     ax1 = axes[0]
-    for map_name in merged_central['map'].unique():
-        map_data = merged_central[merged_central['map'] == map_name]
-        ax1.scatter(map_data['agents'], map_data['speedup'], 
-                   label=map_name.replace('_binary.map', ''), s=80, alpha=0.7)
+    scatter_speedup_by_map(ax1, merged_central, backend)
     
     ax1.axhline(y=1, color='red', linestyle='--', label='Baseline (speedup=1)', alpha=0.5)
     ax1.axhline(y=NUM_PROCESSORS, color='green', linestyle='--', label=f'Ideal ({NUM_PROCESSORS}x)', alpha=0.5)
@@ -164,10 +462,7 @@ def plot_speedup_analysis(merged_central, merged_decentral):
     
     # Decentralized speedup
     ax2 = axes[1]
-    for map_name in merged_decentral['map'].unique():
-        map_data = merged_decentral[merged_decentral['map'] == map_name]
-        ax2.scatter(map_data['agents'], map_data['speedup'], 
-                   label=map_name.replace('_binary.map', ''), s=80, alpha=0.7)
+    scatter_speedup_by_map(ax2, merged_decentral, backend)
     
     ax2.axhline(y=1, color='red', linestyle='--', label='Baseline (speedup=1)', alpha=0.5)
     ax2.axhline(y=NUM_PROCESSORS, color='green', linestyle='--', label=f'Ideal ({NUM_PROCESSORS}x)', alpha=0.5)
@@ -178,26 +473,23 @@ def plot_speedup_analysis(merged_central, merged_decentral):
     ax2.grid(True, alpha=0.3)
     ax2.set_ylim(bottom=0)
     
-    plt.tight_layout()
-    plt.savefig(OUTPUT_DIR / 'speedup_analysis.png', dpi=150, bbox_inches='tight')
-    plt.savefig(OUTPUT_DIR / 'speedup_analysis.pdf', bbox_inches='tight')
-    plt.close()
-    print("✓ Saved speedup_analysis.png/pdf")
+    save_fig(fig, 'speedup_analysis')
 
 def plot_efficiency(merged_central, merged_decentral):
     """Plot parallel efficiency."""
-    fig, ax = plt.subplots(figsize=(12, 6))
+    fig, ax = get_fig((12, 6))
     
     # Calculate mean efficiency by agents
     central_eff = merged_central.groupby('agents')['efficiency'].mean()
     decentral_eff = merged_decentral.groupby('agents')['efficiency'].mean()
     
     width = 0.35
-    agents_list = sorted(set(central_eff.index) | set(decentral_eff.index))
+    agents_list = central_eff.index.union(decentral_eff.index)
     x = np.arange(len(agents_list))
     
-    central_vals = [central_eff.get(a, 0) for a in agents_list]
-    decentral_vals = [decentral_eff.get(a, 0) for a in agents_list]
+    # Agent counts missing from one version plot as 0
+    central_vals = central_eff.reindex(agents_list, fill_value=0).to_numpy()
+    decentral_vals = decentral_eff.reindex(agents_list, fill_value=0).to_numpy()
     
     ax.bar(x - width/2, central_vals, width, label='Centralized', color=COLORS['centralized'], alpha=0.8)
     ax.bar(x + width/2, decentral_vals, width, label='Decentralized', color=COLORS['decentralized'], alpha=0.8)
@@ -211,34 +503,28 @@ def plot_efficiency(merged_central, merged_decentral):
     ax.legend()
     ax.grid(True, alpha=0.3)
     
-    plt.tight_layout()
-    plt.savefig(OUTPUT_DIR / 'efficiency.png', dpi=150, bbox_inches='tight')
-    plt.savefig(OUTPUT_DIR / 'efficiency.pdf', bbox_inches='tight')
-    plt.close()
-    print("✓ Saved efficiency.png/pdf")
+    save_fig(fig, 'efficiency')
 
-def plot_nodes_expanded(serial, central, decentral):
+def plot_nodes_expanded(serial, central, decentral, all_success=None, agg=None):
     """Plot nodes expanded comparison (work done)."""
-    fig, ax = plt.subplots(figsize=(14, 8))
-    
-    all_data = pd.concat([serial, central, decentral])
-    all_data = all_data[all_data['status'] == 'success']
-    all_data = all_data[all_data['nodes_expanded'] > 0]  # Filter out trivial cases
-    
-    agents_list = sorted(all_data['agents'].unique())
+    fig, ax = get_fig((14, 8))
+    
+    if agg is None:
+        if all_success is None:
+            all_success = success_runs(serial, central, decentral)
+        agg = runtime_by_agents(all_success)
+    
+    # Agent counts where every run was trivial (no nodes expanded) are left out
+    nodes = (agg['nodes_mean'].unstack('version')
+             .dropna(how='all')
+             .reindex(columns=VERSIONS)
+             .fillna(0))
+    agents_list = nodes.index.tolist()
     x = np.arange(len(agents_list))
     width = 0.25
     
-    for i, version in enumerate(['serial', 'centralized', 'decentralized']):
-        version_data = all_data[all_data['version'] == version]
-        nodes = []
-        for agents in agents_list:
-            agent_data = version_data[version_data['agents'] == agents]
-            if len(agent_data) > 0:
-                nodes.append(agent_data['nodes_expanded'].mean())
-            else:
-                nodes.append(0)
-        ax.bar(x + i * width, nodes, width, label=version.capitalize(), 
+    for i, version in enumerate(VERSIONS):
+        ax.bar(x + i * width, nodes[version].to_numpy(), width, label=version.capitalize(), 
                color=COLORS[version], alpha=0.8)
     
     ax.set_xlabel('Number of Agents', fontsize=12)
@@ -250,15 +536,11 @@ def plot_nodes_expanded(serial, central, decentral):
     ax.grid(True, alpha=0.3)
     ax.set_yscale('log')
     
-    plt.tight_layout()
-    plt.savefig(OUTPUT_DIR / 'nodes_expanded.png', dpi=150, bbox_inches='tight')
-    plt.savefig(OUTPUT_DIR / 'nodes_expanded.pdf', bbox_inches='tight')
-    plt.close()
-    print("✓ Saved nodes_expanded.png/pdf")
+    save_fig(fig, 'nodes_expanded')
 
 def plot_success_rate(serial, central, decentral):
     """Plot success/timeout/failure rates."""
-    fig, axes = plt.subplots(1, 3, figsize=(15, 5))
+    fig, axes = get_fig((15, 5), 1, 3)
     
     versions = [('Serial', serial), ('Centralized', central), ('Decentralized', decentral)]
     colors_status = {'success': '#2ECC71', 'timeout': '#F39C12', 'failure': '#E74C3C'}
@@ -273,120 +555,120 @@ def plot_success_rate(serial, central, decentral):
                                           colors=colors, startangle=90)
         ax.set_title(f'{name} CBS\n(n={len(data)} runs)', fontsize=12)
     
-    plt.suptitle('Run Status Distribution by CBS Version', fontsize=14, y=1.02)
-    plt.tight_layout()
-    plt.savefig(OUTPUT_DIR / 'success_rate.png', dpi=150, bbox_inches='tight')
-    plt.savefig(OUTPUT_DIR / 'success_rate.pdf', bbox_inches='tight')
-    plt.close()
-    print("✓ Saved success_rate.png/pdf")
+    fig.suptitle('Run Status Distribution by CBS Version', fontsize=14, y=1.02)
+    save_fig(fig, 'success_rate')
 
-def plot_runtime_by_map(serial, central, decentral):
+def plot_runtime_by_map(serial, central, decentral, all_success=None):
     """Plot runtime comparison per map."""
-    all_data = pd.concat([serial, central, decentral])
-    all_data = all_data[all_data['status'] == 'success']
+    if all_success is None:
+        all_success = success_runs(serial, central, decentral)
+    all_data = all_success
     
-    maps = sorted(all_data['map'].unique())
+    maps = sorted(all_data['map_short'].unique())
     n_maps = len(maps)
     
-    fig, axes = plt.subplots(2, 3, figsize=(15, 10))
+    fig, axes = get_fig((15, 10), 2, 3)
     axes = axes.flatten()
     
+    by_map = dict(tuple(all_data.sort_values('agents').groupby('map_short', observed=True)))
+    
     for idx, map_name in enumerate(maps):
         if idx >= 6:
             break
         ax = axes[idx]
-        map_data = all_data[all_data['map'] == map_name]
+        by_version = dict(tuple(by_map[map_name].groupby('version')))
+        versions = [v for v in VERSIONS if v in by_version]
+        segments = [by_version[v][['agents', 'runtime_sec']].to_numpy(dtype=float) for v in versions]
+        colors = [COLORS[v] for v in versions]
         
-        for version in ['serial', 'centralized', 'decentralized']:
-            version_data = map_data[map_data['version'] == version]
-            if len(version_data) > 0:
-                version_data = version_data.sort_values('agents')
-                ax.plot(version_data['agents'], version_data['runtime_sec'], 
-                       marker='o', label=version.capitalize(), color=COLORS[version], 
-                       linewidth=2, markersize=8)
+        # One LineCollection for every version's curve and one scatter for all markers,
+        # instead of a Line2D artist per version
+        ax.set_yscale('log')
+        points = np.concatenate(segments)
+        rasterize = len(points) > RASTERIZE_THRESHOLD
+        ax.add_collection(LineCollection(segments, colors=colors, linewidths=2, rasterized=rasterize))
+        ax.scatter(points[:, 0], points[:, 1], s=64,
+                   c=np.repeat(colors, [len(seg) for seg in segments]), zorder=3,
+                   rasterized=rasterize)
+        ax.autoscale_view()
+        handles = [Line2D([], [], color=COLORS[v], marker='o', linewidth=2, markersize=8,
+                          label=v.capitalize()) for v in versions]
         
         ax.set_xlabel('Agents', fontsize=10)
         ax.set_ylabel('Runtime (s)', fontsize=10)
-        ax.set_title(map_name.replace('_binary.map', ''), fontsize=11)
-        ax.legend(fontsize=8)
+        ax.set_title(map_name, fontsize=11)
+        ax.legend(handles=handles, fontsize=8)
         ax.grid(True, alpha=0.3)
-        ax.set_yscale('log')
     
     # Hide unused subplots
     for idx in range(n_maps, 6):
         axes[idx].set_visible(False)
     
-    plt.suptitle('Runtime by Map and CBS Version', fontsize=14, y=1.02)
-    plt.tight_layout()
-    plt.savefig(OUTPUT_DIR / 'runtime_by_map.png', dpi=150, bbox_inches='tight')
-    plt.savefig(OUTPUT_DIR / 'runtime_by_map.pdf', bbox_inches='tight')
-    plt.close()
-    print("✓ Saved runtime_by_map.png/pdf")
+    fig.suptitle('Runtime by Map and CBS Version', fontsize=14, y=1.02)
+    save_fig(fig, 'runtime_by_map')
 
 def plot_speedup_heatmap(merged_central, merged_decentral):
     """Create heatmaps showing speedup across maps and agent counts."""
-    fig, axes = plt.subplots(1, 2, figsize=(14, 6))
+    fig, axes = get_fig((14, 6), 1, 2)
     
     # Centralized heatmap
     pivot_central = merged_central.pivot_table(
         values='speedup', 
-        index='map', 
+        index='map_short', 
         columns='agents',
-        aggfunc='mean'
+        aggfunc='mean',
+        observed=True  # 'map_short' is categorical; skip maps with no matched runs
     )
-    pivot_central.index = pivot_central.index.str.replace('_binary.map', '')
     
-    im1 = axes[0].imshow(pivot_central.values, cmap='RdYlGn', aspect='auto', 
-                         vmin=0, vmax=max(16, pivot_central.values.max()))
-    axes[0].set_xticks(range(len(pivot_central.columns)))
+    values = pivot_central.to_numpy()
+    # Rasterized mesh: one image in the PDF instead of a vector patch per cell
+    im1 = axes[0].pcolormesh(np.ma.masked_invalid(values), cmap='RdYlGn',
+                             vmin=0, vmax=max(16, np.nanmax(values)), rasterized=True)
+    axes[0].invert_yaxis()  # first map on top, matching the table order
+    axes[0].set_xticks(np.arange(len(pivot_central.columns)) + 0.5)
     axes[0].set_xticklabels(pivot_central.columns)
-    axes[0].set_yticks(range(len(pivot_central.index)))
+    axes[0].set_yticks(np.arange(len(pivot_central.index)) + 0.5)
     axes[0].set_yticklabels(pivot_central.index)
     axes[0].set_xlabel('Number of Agents')
     axes[0].set_ylabel('Map')
     axes[0].set_title('Centralized CBS Speedup')
     plt.colorbar(im1, ax=axes[0], label='Speedup')
     
-    # Add text annotations
-    for i in range(len(pivot_central.index)):
-        for j in range(len(pivot_central.columns)):
-            val = pivot_central.values[i, j]
-            if not np.isnan(val):
-                axes[0].text(j, i, f'{val:.1f}', ha='center', va='center', fontsize=9)
+    # Add text annotations for the filled cells only
+    rows, cols = np.nonzero(~np.isnan(values))
+    for i, j, label in zip(rows, cols, np.char.mod('%.1f', values[rows, cols])):
+        axes[0].text(j + 0.5, i + 0.5, label, ha='center', va='center', fontsize=9)
     
     # Decentralized heatmap
     pivot_decentral = merged_decentral.pivot_table(
         values='speedup', 
-        index='map', 
+        index='map_short', 
         columns='agents',
-        aggfunc='mean'
+        aggfunc='mean',
+        observed=True  # 'map_short' is categorical; skip maps with no matched runs
     )
-    pivot_decentral.index = pivot_decentral.index.str.replace('_binary.map', '')
     
-    im2 = axes[1].imshow(pivot_decentral.values, cmap='RdYlGn', aspect='auto',
-                         vmin=0, vmax=max(16, pivot_decentral.values.max()))
-    axes[1].set_xticks(range(len(pivot_decentral.columns)))
+    values = pivot_decentral.to_numpy()
+    # Rasterized mesh: one image in the PDF instead of a vector patch per cell
+    im2 = axes[1].pcolormesh(np.ma.masked_invalid(values), cmap='RdYlGn',
+                             vmin=0, vmax=max(16, np.nanmax(values)), rasterized=True)
+    axes[1].invert_yaxis()  # first map on top, matching the table order
+    axes[1].set_xticks(np.arange(len(pivot_decentral.columns)) + 0.5)
     axes[1].set_xticklabels(pivot_decentral.columns)
-    axes[1].set_yticks(range(len(pivot_decentral.index)))
+    axes[1].set_yticks(np.arange(len(pivot_decentral.index)) + 0.5)
     axes[1].set_yticklabels(pivot_decentral.index)
     axes[1].set_xlabel('Number of Agents')
     axes[1].set_ylabel('Map')
     axes[1].set_title('Decentralized CBS Speedup')
     plt.colorbar(im2, ax=axes[1], label='Speedup')
     
-    # Add text annotations
-    for i in range(len(pivot_decentral.index)):
-        for j in range(len(pivot_decentral.columns)):
-            val = pivot_decentral.values[i, j]
-            if not np.isnan(val):
-                axes[1].text(j, i, f'{val:.1f}', ha='center', va='center', fontsize=9)
+    # Add text annotations for the filled cells only
+    rows, cols = np.nonzero(~np.isnan(values))
+    for i, j, label in zip(rows, cols, np.char.mod('%.1f', values[rows, cols])):
+        axes[1].text(j + 0.5, i + 0.5, label, ha='center', va='center', fontsize=9)
     
-    plt.suptitle(f'Speedup Heatmaps (Serial / Parallel, {NUM_PROCESSORS} processors)', fontsize=14, y=1.02)
-    plt.tight_layout()
-    plt.savefig(OUTPUT_DIR / 'speedup_heatmap.png', dpi=150, bbox_inches='tight')
-    plt.savefig(OUTPUT_DIR / 'speedup_heatmap.pdf', bbox_inches='tight')
-    plt.close()
-    print("✓ Saved speedup_heatmap.png/pdf")
+    fig.suptitle(f'Speedup Heatmaps (Serial / Parallel, {NUM_PROCESSORS} processors)', fontsize=14, y=1.02)
+    save_fig(fig, 'speedup_heatmap')
 
 def plot_comm_compute_breakdown(central, decentral):
     """Plot communication vs computation time breakdown for parallel versions."""
@@ -398,7 +680,7 @@ def plot_comm_compute_breakdown(central, decentral):
         print("⚠ No communication/computation timing data available (run new benchmarks)")
         return
     
-    fig, axes = plt.subplots(1, 2, figsize=(14, 6))
+    fig, axes = get_fig((14, 6), 1, 2)
     
     # Centralized breakdown
     ax1 = axes[0]
@@ -454,12 +736,19 @@ def plot_comm_compute_breakdown(central, decentral):
         ax2.text(0.5, 0.5, 'No timing data', ha='center', va='center', transform=ax2.transAxes)
         ax2.set_title('Decentralized CBS\n(No data)')
     
-    plt.suptitle('Communication vs Computation Time', fontsize=14, y=1.02)
-    plt.tight_layout()
-    plt.savefig(OUTPUT_DIR / 'comm_compute_breakdown.png', dpi=150, bbox_inches='tight')
-    plt.savefig(OUTPUT_DIR / 'comm_compute_breakdown.pdf', bbox_inches='tight')
-    plt.close()
-    print("✓ Saved comm_compute_breakdown.png/pdf")
+    fig.suptitle('Communication vs Computation Time', fontsize=14, y=1.02)
+    save_fig(fig, 'comm_compute_breakdown')
+
+def comm_pct_runs(data):
+    """Agents and communication % of total time for successful runs over 10ms."""
+    mask = (data['status'].to_numpy() == 'success') & (data['runtime_sec'].to_numpy() > 0.01)
+    agents = data['agents'].to_numpy()[mask]
+    comm = data['comm_time_sec'].to_numpy(dtype=np.float64)[mask]
+    total = comm + data['compute_time_sec'].to_numpy(dtype=np.float64)[mask]
+    # Runs with no (or missing) timing count as 0%
+    pct = np.zeros_like(total)
+    np.divide(comm * 100, total, out=pct, where=total > 0)
+    return agents, pct
 
 def plot_comm_percentage(central, decentral):
     """Plot communication time as percentage of total runtime."""
@@ -469,43 +758,34 @@ def plot_comm_percentage(central, decentral):
     if not has_central_timing and not has_decentral_timing:
         return
     
-    fig, ax = plt.subplots(figsize=(12, 6))
-    
-    all_data = []
+    fig, ax = get_fig((12, 6))
     
+    runs = {}
     if has_central_timing:
-        central_success = central[(central['status'] == 'success') & (central['runtime_sec'] > 0.01)].copy()
-        if len(central_success) > 0:
-            total_time = central_success['comm_time_sec'] + central_success['compute_time_sec']
-            central_success['comm_pct'] = np.where(total_time > 0, (central_success['comm_time_sec'] / total_time) * 100, 0)
-            central_success['version'] = 'centralized'
-            all_data.append(central_success[['agents', 'comm_pct', 'version']])
-    
+        runs['centralized'] = comm_pct_runs(central)
     if has_decentral_timing:
-        decentral_success = decentral[(decentral['status'] == 'success') & (decentral['runtime_sec'] > 0.01)].copy()
-        if len(decentral_success) > 0:
-            total_time = decentral_success['comm_time_sec'] + decentral_success['compute_time_sec']
-            decentral_success['comm_pct'] = np.where(total_time > 0, (decentral_success['comm_time_sec'] / total_time) * 100, 0)
-            decentral_success['version'] = 'decentralized'
-            all_data.append(decentral_success[['agents', 'comm_pct', 'version']])
+        runs['decentralized'] = comm_pct_runs(decentral)
+    runs = {version: run for version, run in runs.items() if len(run[0]) > 0}
     
-    if not all_data:
-        plt.close()
+    if not runs:
         return
     
-    combined = pd.concat(all_data)
-    agents_list = sorted(combined['agents'].unique())
+    agents_list = np.unique(np.concatenate([agents for agents, _ in runs.values()]))
     x = np.arange(len(agents_list))
     width = 0.35
     
-    central_pcts = []
-    decentral_pcts = []
-    for agents in agents_list:
-        agent_data = combined[combined['agents'] == agents]
-        c_data = agent_data[agent_data['version'] == 'centralized']
-        d_data = agent_data[agent_data['version'] == 'decentralized']
-        central_pcts.append(c_data['comm_pct'].mean() if len(c_data) > 0 else 0)
-        decentral_pcts.append(d_data['comm_pct'].mean() if len(d_data) > 0 else 0)
+    # Mean comm % per agent count via weighted bincount; versions without runs plot as 0
+    means = {}
+    for version in ['centralized', 'decentralized']:
+        means[version] = np.zeros(len(agents_list))
+        if version in runs:
+            agents, pct = runs[version]
+            idx = np.searchsorted(agents_list, agents)
+            sums = np.bincount(idx, weights=pct, minlength=len(agents_list))
+            counts = np.bincount(idx, minlength=len(agents_list))
+            np.divide(sums, counts, out=means[version], where=counts > 0)
+    central_pcts = means['centralized']
+    decentral_pcts = means['decentralized']
     
     ax.bar(x - width/2, central_pcts, width, label='Centralized', color=COLORS['centralized'], alpha=0.8)
     ax.bar(x + width/2, decentral_pcts, width, label='Decentralized', color=COLORS['decentralized'], alpha=0.8)
@@ -519,13 +799,10 @@ def plot_comm_percentage(central, decentral):
     ax.grid(True, alpha=0.3)
     ax.set_ylim(0, 100)
     
-    plt.tight_layout()
-    plt.savefig(OUTPUT_DIR / 'comm_percentage.png', dpi=150, bbox_inches='tight')
-    plt.savefig(OUTPUT_DIR / 'comm_percentage.pdf', bbox_inches='tight')
-    plt.close()
-    print("✓ Saved comm_percentage.png/pdf")
+    save_fig(fig, 'comm_percentage')
 
-def generate_summary_stats(serial, central, decentral, merged_central, merged_decentral):
+def generate_summary_stats(serial, central, decentral, merged_central, merged_decentral,
+                           all_success=None, agg=None):
     """Generate and save summary statistics."""
     summary = []
     
@@ -536,12 +813,11 @@ def generate_summary_stats(serial, central, decentral, merged_central, merged_de
     
     # Overall statistics
     summary.append("\n--- Run Statistics ---")
-    for name, data in [('Serial', serial), ('Centralized', central), ('Decentralized', decentral)]:
-        success = len(data[data['status'] == 'success'])
-        timeout = len(data[data['status'] == 'timeout'])
-        failure = len(data[data['status'] == 'failure'])
-        total = len(data)
-        summary.append(f"{name:15}: {success:3} success, {timeout:3} timeout, {failure:3} failure (total: {total})")
+    runs = pd.concat([df[['version', 'status']] for df in (serial, central, decentral)], ignore_index=True)
+    status_counts = (pd.crosstab(runs['version'], runs['status'])
+                     .reindex(index=VERSIONS, columns=['success', 'timeout', 'failure'], fill_value=0))
+    status_counts['total'] = runs['version'].value_counts()
+    summary.append(status_counts.to_string())
     
     # Speedup statistics
     summary.append("\n--- Speedup Statistics ---")
@@ -561,16 +837,16 @@ def generate_summary_stats(serial, central, decentral, merged_central, merged_de
     
     # Runtime comparison (successful runs only)
     summary.append("\n--- Average Runtime by Agents (successful runs) ---")
-    all_data = pd.concat([serial, central, decentral])
-    all_data = all_data[all_data['status'] == 'success']
-    
-    for agents in sorted(all_data['agents'].unique()):
-        agent_data = all_data[all_data['agents'] == agents]
-        summary.append(f"Agents = {agents}:")
-        for version in ['serial', 'centralized', 'decentralized']:
-            version_data = agent_data[agent_data['version'] == version]
-            if len(version_data) > 0:
-                summary.append(f"  {version:15}: {version_data['runtime_sec'].mean():.3f}s (n={len(version_data)})")
+    if agg is None:
+        if all_success is None:
+            all_success = success_runs(serial, central, decentral)
+        agg = runtime_by_agents(all_success)
+    # Rows are agent counts; mean runtime and run count per version, '-' where a version has no runs
+    runtime_stats = pd.concat({
+        'mean runtime': agg['runtime_mean'].unstack('version').reindex(columns=VERSIONS),
+        'n': agg['n'].unstack('version').reindex(columns=VERSIONS).astype('Int64'),
+    }, axis=1)
+    summary.append(runtime_stats.to_string(float_format='{:.3f}s'.format, na_rep='-'))
     
     summary.append("\n" + "=" * 70)
     
@@ -583,23 +859,32 @@ def generate_summary_stats(serial, central, decentral, merged_central, merged_de
     
     return summary_text
 
+def write_comparison_csv(merged, suffix, path):
+    """Write one serial-vs-<suffix> comparison table, floats rounded to 4 places."""
+    def rounded(col):
+        return np.round(merged[col].to_numpy(dtype=np.float32), 4)
+    
+    columns = {
+        'map': merged['map'].astype('category'),
+        'agents': merged['agents'].to_numpy(),
+        'serial_runtime': rounded('runtime_sec_serial'),
+        f'{suffix}_runtime': rounded(f'runtime_sec_{suffix}'),
+        'speedup': rounded('speedup'),
+        'efficiency_pct': rounded('efficiency'),
+        # Nullable Int64: runs without a node count are written as empty fields
+        'serial_nodes': merged['nodes_expanded_serial'],
+        f'{suffix}_nodes': merged[f'nodes_expanded_{suffix}'],
+    }
+    if CSV_ENGINE == "pyarrow":
+        table = pa.table({name: pa.array(values) for name, values in columns.items()})
+        pa_csv.write_csv(table, path, write_options=pa_csv.WriteOptions(batch_size=8192))
+    else:
+        pd.DataFrame(columns).to_csv(path, index=False)
+
 def export_comparison_csv(merged_central, merged_decentral):
     """Export detailed comparison data to CSV."""
-    # Centralized comparison
-    central_export = merged_central[['map', 'agents', 'runtime_sec_serial', 'runtime_sec_central', 
-                                      'speedup', 'efficiency', 'nodes_expanded_serial', 'nodes_expanded_central']].copy()
-    central_export.columns = ['map', 'agents', 'serial_runtime', 'central_runtime', 
-                              'speedup', 'efficiency_pct', 'serial_nodes', 'central_nodes']
-    central_export = central_export.round(4)
-    central_export.to_csv(OUTPUT_DIR / 'comparison_central.csv', index=False)
-    
-    # Decentralized comparison
-    decentral_export = merged_decentral[['map', 'agents', 'runtime_sec_serial', 'runtime_sec_decentral',
-                                          'speedup', 'efficiency', 'nodes_expanded_serial', 'nodes_expanded_decentral']].copy()
-    decentral_export.columns = ['map', 'agents', 'serial_runtime', 'decentral_runtime',
-                                'speedup', 'efficiency_pct', 'serial_nodes', 'decentral_nodes']
-    decentral_export = decentral_export.round(4)
-    decentral_export.to_csv(OUTPUT_DIR / 'comparison_decentral.csv', index=False)
+    write_comparison_csv(merged_central, 'central', OUTPUT_DIR / 'comparison_central.csv')
+    write_comparison_csv(merged_decentral, 'decentral', OUTPUT_DIR / 'comparison_decentral.csv')
     
     print("✓ Saved comparison_central.csv and comparison_decentral.csv")
 
@@ -629,19 +914,44 @@ def main():
     
     # Generate plots
     print("\n--- Generating plots ---")
-    plot_runtime_comparison(serial, central, decentral)
-    plot_speedup_analysis(merged_central, merged_decentral)
-    plot_efficiency(merged_central, merged_decentral)
-    plot_nodes_expanded(serial, central, decentral)
-    plot_success_rate(serial, central, decentral)
-    plot_runtime_by_map(serial, central, decentral)
-    plot_speedup_heatmap(merged_central, merged_decentral)
-    plot_comm_compute_breakdown(central, decentral)
-    plot_comm_percentage(central, decentral)
+    # Successful runs of every version, shared by the plots and the summary
+    all_success = success_runs(serial, central, decentral)
+    runtime_agg = agg_runtime_by_agents()
+    plot_jobs = [
+        (plot_runtime_comparison, (serial, central, decentral, all_success, runtime_agg), 'runtime_comparison'),
+        (plot_speedup_analysis, (merged_central, merged_decentral), 'speedup_analysis'),
+        (plot_efficiency, (merged_central, merged_decentral), 'efficiency'),
+        (plot_nodes_expanded, (serial, central, decentral, all_success, runtime_agg), 'nodes_expanded'),
+        (plot_success_rate, (serial, central, decentral), 'success_rate'),
+        (plot_runtime_by_map, (serial, central, decentral, all_success), 'runtime_by_map'),
+        (plot_speedup_heatmap, (merged_central, merged_decentral), 'speedup_heatmap'),
+        (plot_comm_compute_breakdown, (central, decentral), 'comm_compute_breakdown'),
+        (plot_comm_percentage, (central, decentral), 'comm_percentage'),
+    ]
+    
+    # Skip plots whose inputs and code are unchanged since the last run
+    manifest = read_manifest()
+    plot_funcs = [plot_func for plot_func, _, _ in plot_jobs]
+    pending = []
+    for plot_func, args, stem in plot_jobs:
+        key = plot_key(plot_func, args, plot_funcs)
+        if plot_up_to_date(manifest, plot_func, key, stem):
+            print(f"✓ {stem}.png/pdf up to date")
+        else:
+            pending.append((plot_func, args))
+            manifest[plot_func.__name__] = key
+    
+    # Plots are independent and CPU-bound; workers inherit the Agg backend from the import
+    if pending:
+        with ProcessPoolExecutor(max_workers=min(len(pending), os.cpu_count())) as ex:
+            list(ex.map(run_plot, pending))
+    manifest_text = json.dumps(manifest, indent=2)
+    replace_atomically(MANIFEST_FILE, lambda tmp_path: Path(tmp_path).write_text(manifest_text))
     
     # Generate statistics
     print("\n--- Generating summary ---")
-    generate_summary_stats(serial, central, decentral, merged_central, merged_decentral)
+    generate_summary_stats(serial, central, decentral, merged_central, merged_decentral,
+                           all_success, runtime_agg)
     
     # Export comparison data
     print("\n--- Exporting comparison data ---")